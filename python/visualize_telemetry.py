@@ -7,16 +7,133 @@ comprehensive visualizations for post-flight analysis.
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
+import argparse
 import sys
 import os
+import pickle
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+# Flight phase names as written by FlightController::getPhaseString, in
+# flight order. A fixed category set keeps the codes stable across chunks.
+FLIGHT_PHASES = ['PREFLIGHT', 'TAKEOFF', 'CLIMB', 'CRUISE', 'DESCENT',
+                 'APPROACH', 'LANDING', 'EMERGENCY', 'UNKNOWN']
+
+# Display colour of each flight phase; anything else uses PHASE_COLOR_DEFAULT
+PHASE_COLORS = {
+    'PREFLIGHT': 'gray',
+    'TAKEOFF': '#ff6b6b',
+    'CLIMB': '#4ecdc4',
+    'CRUISE': '#45b7d1',
+    'DESCENT': '#f9ca24',
+    'APPROACH': '#f0932b',
+    'LANDING': '#6ab04c',
+    'EMERGENCY': '#eb4d4b'
+}
+PHASE_COLOR_DEFAULT = '#95a5a6'
+
+# Column schema of the TelemetryLogger CSV output. Pinning dtypes skips
+# pandas' per-column type inference and halves the float footprint.
+DTYPES = {
+    'Timestamp': 'object',
+    'SimulationTime': 'float32',
+    'Altitude': 'float32',
+    'Airspeed': 'float32',
+    'Pressure': 'float32',
+    'Temperature': 'float32',
+    'VerticalSpeed': 'float32',
+    'FlightPhase': 'category',
+    'Elevator': 'float32',
+    'Aileron': 'float32',
+    'Rudder': 'float32',
+    'Throttle': 'float32',
+    'ActiveFaults': 'uint16',
+    'SensorValid': 'bool',
+}
+
+# Rows per read_csv chunk (~100 bytes/row, so a few hundred MB of text)
+CHUNK_ROWS = 2_000_000
+
+# Arrow IPC cache written next to the CSV on first load. It is left
+# uncompressed so numeric columns can be memory-mapped without copying.
+CACHE_SUFFIX = '.arrow'
+
+def _arrow_column_types():
+    """Translate DTYPES into pyarrow CSV column types."""
+    types = {}
+    for column, dtype in DTYPES.items():
+        if column == 'FlightPhase':
+            types[column] = pa.dictionary(pa.int32(), pa.string())
+        elif dtype == 'object':
+            types[column] = pa.string()
+        else:
+            types[column] = pa.from_numpy_dtype(np.dtype(dtype))
+    return types
+
+def _normalize_phases(df):
+    """Recode FlightPhase onto FLIGHT_PHASES, mapping unrecognised names to UNKNOWN."""
+    df['FlightPhase'] = (df['FlightPhase'].cat.set_categories(FLIGHT_PHASES)
+                         .fillna('UNKNOWN'))
+    return df
+
+def _read_csv(filename):
+    """Parse the telemetry CSV with the pinned dtype schema."""
+    if pa is None:
+        reader = pd.read_csv(filename, dtype=DTYPES, engine='c',
+                             chunksize=CHUNK_ROWS)
+        return pd.concat((_normalize_phases(chunk) for chunk in reader),
+                         ignore_index=True)
+
+    options = pacsv.ConvertOptions(column_types=_arrow_column_types())
+    df = pacsv.read_csv(filename, convert_options=options).to_pandas()
+    return _normalize_phases(df)
+
+def _write_cache(df, cache):
+    """Write the parsed frame to an Arrow IPC cache, ignoring write failures."""
+    # Write beside the cache and rename into place only once complete, so an
+    # interrupted or failed write never leaves a truncated file that looks fresh
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.OSFile(tmp, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, cache)
+    except (OSError, pa.ArrowException) as e:
+        print(f"Warning: could not write cache '{cache}': {e}")
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+def _read_cache(cache):
+    """Memory-map an Arrow IPC cache; pages are only read when touched."""
+    table = pa.ipc.open_file(pa.memory_map(cache, 'r')).read_all()
+    # Numeric columns without nulls become views onto the mapped file
+    return _normalize_phases(table.to_pandas(split_blocks=True, self_destruct=True))
+
 def load_telemetry(filename):
-    """Load telemetry data from CSV file."""
+    """Load telemetry data from CSV file, using an Arrow cache if fresh."""
     try:
-        df = pd.read_csv(filename)
+        cache = filename + CACHE_SUFFIX
+        df = None
+        if (pa is not None and os.path.exists(cache)
+                and os.path.getmtime(cache) >= os.path.getmtime(filename)):
+            try:
+                df = _read_cache(cache)
+            except (OSError, KeyError, pa.ArrowException) as e:
+                print(f"Warning: ignoring unreadable cache '{cache}': {e}")
+        if df is None:
+            df = _read_csv(filename)
+            if pa is not None:
+                _write_cache(df, cache)
         print(f"Loaded {len(df)} data points from {filename}")
         return df
     except FileNotFoundError:
@@ -26,37 +143,128 @@ def load_telemetry(filename):
         print(f"Error loading file: {e}")
         sys.exit(1)
 
-def plot_flight_profile(df):
+# Points kept per plotted series; a 14 inch axis at 300 DPI is ~4200 pixels wide
+DECIMATE_POINTS = 8000
+
+def _decimate(t, y, n_target=DECIMATE_POINTS):
+    """Reduce a series to about n_target points, keeping each bucket's min and max."""
+    t = np.asarray(t)
+    y = np.asarray(y)
+    n = len(y)
+    if n <= n_target:
+        return t, y
+    
+    # Split into equal buckets (padding the tail with the last sample) and
+    # keep the extremes of each so peaks survive the reduction
+    bucket = -(-n // (n_target // 2))
+    rows = -(-n // bucket)
+    padded = np.pad(y, (0, rows * bucket - n), mode='edge').reshape(rows, bucket)
+    base = np.arange(rows) * bucket
+    idx = np.concatenate([base + padded.argmin(axis=1),
+                          base + padded.argmax(axis=1), [0, n - 1]])
+    idx = np.unique(np.minimum(idx, n - 1))
+    return t[idx], y[idx]
+
+def _configure_matplotlib(backend=None):
+    """Apply rendering settings; matplotlib is only imported when plotting."""
+    import matplotlib
+    if backend is not None:
+        matplotlib.use(backend)
+    # Simplify dense paths and render them in chunks to keep redraws cheap
+    matplotlib.rcParams['path.simplify'] = True
+    matplotlib.rcParams['agg.path.chunksize'] = 10000
+
+def _columns(df, *names):
+    """Return zero-copy numpy views of the named columns."""
+    return {name: df[name].to_numpy(copy=False) for name in names}
+
+def _pin_limits(ax, t, y=None, include_zero=False):
+    """Fix axis limits to the data so interactive redraws skip autoscaling."""
+    ax.set_xlim(t[0], t[-1])
+    if y is not None:
+        if np.isnan(y).all():
+            return  # Leave an all-NaN series to autoscaling
+        low, high = float(np.nanmin(y)), float(np.nanmax(y))
+        if not (np.isfinite(low) and np.isfinite(high)):
+            return
+        if include_zero:
+            low, high = min(low, 0.0), max(high, 0.0)
+        margin = (high - low) * 0.05 or 1.0
+        ax.set_ylim(low - margin, high + margin)
+
+def compute_time_range(df):
+    """Return the first and last SimulationTime; the log is written in time order."""
+    time = df['SimulationTime'].to_numpy(copy=False)
+    if len(time) == 0:
+        return np.nan, np.nan
+    return time[0], time[-1]
+
+def compute_phase_bounds(df):
+    """Return first/last SimulationTime and category code of each phase segment.
+    
+    Phases are run-length encoded, so a phase that is entered more than
+    once (e.g. CRUISE before and after an EMERGENCY) gets one row per visit.
+    """
+    time = df['SimulationTime'].to_numpy(copy=False)
+    codes = df['FlightPhase'].cat.codes.to_numpy()
+    change = np.nonzero(np.diff(codes))[0] + 1
+    first = np.r_[0, change] if len(codes) else change
+    last = np.r_[change, len(codes)] - 1 if len(codes) else change
+    phases = df['FlightPhase'].cat.categories[codes[first]]
+    return pd.DataFrame({'first': time[first], 'last': time[last],
+                         'code': codes[first]},
+                        index=pd.Index(phases, name='FlightPhase'))
+
+def _phase_colors(df, phase_bounds):
+    """Return an RGBA row per phase in phase_bounds, looked up by category code."""
+    import matplotlib.colors as mcolors
+    palette = np.array([mcolors.to_rgba(PHASE_COLORS.get(phase, PHASE_COLOR_DEFAULT))
+                        for phase in df['FlightPhase'].cat.categories])
+    return palette[phase_bounds['code'].to_numpy()]
+
+def plot_flight_profile(df, phase_bounds):
     """Create flight profile visualization."""
-    fig, axes = plt.subplots(3, 1, figsize=(14, 10))
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import PolyCollection
+    
+    fig, axes = plt.subplots(3, 1, figsize=(14, 10), dpi=100, sharex=True)
     fig.suptitle('Flight Profile Analysis', fontsize=16, fontweight='bold')
+    cols = _columns(df, 'SimulationTime', 'Altitude', 'Airspeed', 'VerticalSpeed')
+    time = cols['SimulationTime']
     
     # Altitude profile
-    axes[0].plot(df['SimulationTime'], df['Altitude'], 'b-', linewidth=2, label='Altitude')
+    t, y = _decimate(time, cols['Altitude'])
+    axes[0].plot(t, y, 'b-', linewidth=2, label='Altitude')
+    _pin_limits(axes[0], t, y)
     axes[0].set_ylabel('Altitude (m)', fontsize=12)
     axes[0].set_title('Altitude Profile')
     axes[0].grid(True, alpha=0.3)
     axes[0].legend()
     
-    # Add flight phase markers
-    phases = df['FlightPhase'].unique()
-    colors = plt.cm.Set3(np.linspace(0, 1, len(phases)))
-    for i, phase in enumerate(phases):
-        phase_data = df[df['FlightPhase'] == phase]
-        if not phase_data.empty:
-            axes[0].axvspan(phase_data['SimulationTime'].iloc[0], 
-                          phase_data['SimulationTime'].iloc[-1],
-                          alpha=0.2, color=colors[i], label=phase)
+    # Add flight phase markers as one collection spanning the full axis height
+    colors = _phase_colors(df, phase_bounds)
+    starts = phase_bounds['first'].to_numpy()
+    ends = phase_bounds['last'].to_numpy()
+    verts = [[(start, 0), (start, 1), (end, 1), (end, 0)]
+             for start, end in zip(starts, ends)]
+    axes[0].add_collection(
+        PolyCollection(verts, facecolors=colors, edgecolors='none', alpha=0.2,
+                       transform=axes[0].get_xaxis_transform()),
+        autolim=False)
     
     # Airspeed profile
-    axes[1].plot(df['SimulationTime'], df['Airspeed'], 'r-', linewidth=2, label='Airspeed')
+    t, y = _decimate(time, cols['Airspeed'])
+    axes[1].plot(t, y, 'r-', linewidth=2, label='Airspeed')
+    _pin_limits(axes[1], t, y)
     axes[1].set_ylabel('Airspeed (m/s)', fontsize=12)
     axes[1].set_title('Airspeed Profile')
     axes[1].grid(True, alpha=0.3)
     axes[1].legend()
     
     # Vertical speed profile
-    axes[2].plot(df['SimulationTime'], df['VerticalSpeed'], 'g-', linewidth=2, label='Vertical Speed')
+    t, y = _decimate(time, cols['VerticalSpeed'])
+    axes[2].plot(t, y, 'g-', linewidth=2, label='Vertical Speed')
+    _pin_limits(axes[2], t, y, include_zero=True)
     axes[2].axhline(y=0, color='k', linestyle='--', alpha=0.5)
     axes[2].set_xlabel('Simulation Time (s)', fontsize=12)
     axes[2].set_ylabel('Vertical Speed (m/s)', fontsize=12)
@@ -69,11 +277,17 @@ def plot_flight_profile(df):
 
 def plot_control_surfaces(df):
     """Visualize control surface positions."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    import matplotlib.pyplot as plt
+    
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), dpi=100, sharex=True)
     fig.suptitle('Control Surface Analysis', fontsize=16, fontweight='bold')
+    cols = _columns(df, 'SimulationTime', 'Elevator', 'Aileron', 'Rudder', 'Throttle')
+    time = cols['SimulationTime']
     
     # Elevator
-    axes[0, 0].plot(df['SimulationTime'], df['Elevator'], 'b-', linewidth=2)
+    t, y = _decimate(time, cols['Elevator'])
+    axes[0, 0].plot(t, y, 'b-', linewidth=2)
+    _pin_limits(axes[0, 0], t)
     axes[0, 0].set_ylabel('Elevator Position', fontsize=11)
     axes[0, 0].set_title('Elevator Control')
     axes[0, 0].axhline(y=0, color='k', linestyle='--', alpha=0.5)
@@ -81,7 +295,9 @@ def plot_control_surfaces(df):
     axes[0, 0].set_ylim(-1.1, 1.1)
     
     # Aileron
-    axes[0, 1].plot(df['SimulationTime'], df['Aileron'], 'r-', linewidth=2)
+    t, y = _decimate(time, cols['Aileron'])
+    axes[0, 1].plot(t, y, 'r-', linewidth=2)
+    _pin_limits(axes[0, 1], t)
     axes[0, 1].set_ylabel('Aileron Position', fontsize=11)
     axes[0, 1].set_title('Aileron Control')
     axes[0, 1].axhline(y=0, color='k', linestyle='--', alpha=0.5)
@@ -89,7 +305,9 @@ def plot_control_surfaces(df):
     axes[0, 1].set_ylim(-1.1, 1.1)
     
     # Rudder
-    axes[1, 0].plot(df['SimulationTime'], df['Rudder'], 'g-', linewidth=2)
+    t, y = _decimate(time, cols['Rudder'])
+    axes[1, 0].plot(t, y, 'g-', linewidth=2)
+    _pin_limits(axes[1, 0], t)
     axes[1, 0].set_xlabel('Simulation Time (s)', fontsize=11)
     axes[1, 0].set_ylabel('Rudder Position', fontsize=11)
     axes[1, 0].set_title('Rudder Control')
@@ -98,7 +316,9 @@ def plot_control_surfaces(df):
     axes[1, 0].set_ylim(-1.1, 1.1)
     
     # Throttle
-    axes[1, 1].plot(df['SimulationTime'], df['Throttle'], 'm-', linewidth=2)
+    t, y = _decimate(time, cols['Throttle'])
+    axes[1, 1].plot(t, y, 'm-', linewidth=2)
+    _pin_limits(axes[1, 1], t)
     axes[1, 1].set_xlabel('Simulation Time (s)', fontsize=11)
     axes[1, 1].set_ylabel('Throttle Position', fontsize=11)
     axes[1, 1].set_title('Throttle Control')
@@ -110,139 +330,206 @@ def plot_control_surfaces(df):
 
 def plot_sensor_data(df):
     """Visualize sensor readings."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    import matplotlib.pyplot as plt
+    
+    fig, axes = plt.subplots(2, 2, figsize=(14, 10), dpi=100, sharex=True)
     fig.suptitle('Sensor Data Analysis', fontsize=16, fontweight='bold')
+    cols = _columns(df, 'SimulationTime', 'Altitude', 'Pressure', 'Temperature', 'ActiveFaults')
+    time = cols['SimulationTime']
     
     # Altitude sensor
-    axes[0, 0].plot(df['SimulationTime'], df['Altitude'], 'b-', linewidth=1.5)
+    t, y = _decimate(time, cols['Altitude'])
+    axes[0, 0].plot(t, y, 'b-', linewidth=1.5)
+    _pin_limits(axes[0, 0], t, y)
     axes[0, 0].set_ylabel('Altitude (m)', fontsize=11)
     axes[0, 0].set_title('Altitude Sensor')
     axes[0, 0].grid(True, alpha=0.3)
     
     # Pressure sensor
-    axes[0, 1].plot(df['SimulationTime'], df['Pressure'], 'r-', linewidth=1.5)
+    t, y = _decimate(time, cols['Pressure'])
+    axes[0, 1].plot(t, y, 'r-', linewidth=1.5)
+    _pin_limits(axes[0, 1], t, y)
     axes[0, 1].set_ylabel('Pressure (hPa)', fontsize=11)
     axes[0, 1].set_title('Pressure Sensor')
     axes[0, 1].grid(True, alpha=0.3)
     
     # Temperature sensor
-    axes[1, 0].plot(df['SimulationTime'], df['Temperature'], 'g-', linewidth=1.5)
+    t, y = _decimate(time, cols['Temperature'])
+    axes[1, 0].plot(t, y, 'g-', linewidth=1.5)
+    _pin_limits(axes[1, 0], t, y)
     axes[1, 0].set_xlabel('Simulation Time (s)', fontsize=11)
     axes[1, 0].set_ylabel('Temperature (°C)', fontsize=11)
     axes[1, 0].set_title('Temperature Sensor')
     axes[1, 0].grid(True, alpha=0.3)
     
     # Fault indicator
-    axes[1, 1].plot(df['SimulationTime'], df['ActiveFaults'], 'k-', linewidth=2)
+    fault_time, faults = _decimate(time, cols['ActiveFaults'])
+    axes[1, 1].plot(fault_time, faults, 'k-', linewidth=2)
+    _pin_limits(axes[1, 1], fault_time, faults, include_zero=True)
     axes[1, 1].set_xlabel('Simulation Time (s)', fontsize=11)
     axes[1, 1].set_ylabel('Active Faults', fontsize=11)
     axes[1, 1].set_title('System Faults Over Time')
     axes[1, 1].grid(True, alpha=0.3)
-    axes[1, 1].fill_between(df['SimulationTime'], 0, df['ActiveFaults'], 
+    axes[1, 1].fill_between(fault_time, 0, faults, 
                             alpha=0.3, color='red', label='Fault Periods')
     
     plt.tight_layout()
     return fig
 
-def plot_phase_timeline(df):
+def plot_phase_timeline(df, phase_bounds, time_range):
     """Create flight phase timeline."""
-    fig, ax = plt.subplots(figsize=(14, 4))
-    
-    phases = df['FlightPhase'].unique()
-    phase_colors = {
-        'PREFLIGHT': '#gray',
-        'TAKEOFF': '#ff6b6b',
-        'CLIMB': '#4ecdc4',
-        'CRUISE': '#45b7d1',
-        'DESCENT': '#f9ca24',
-        'APPROACH': '#f0932b',
-        'LANDING': '#6ab04c',
-        'EMERGENCY': '#eb4d4b'
-    }
-    
-    for phase in phases:
-        phase_data = df[df['FlightPhase'] == phase]
-        if not phase_data.empty:
-            start_time = phase_data['SimulationTime'].iloc[0]
-            end_time = phase_data['SimulationTime'].iloc[-1]
-            duration = end_time - start_time
-            
-            color = phase_colors.get(phase, '#95a5a6')
-            ax.barh(0, duration, left=start_time, height=0.8, 
-                   color=color, label=phase, edgecolor='black', linewidth=1.5)
-            
-            # Add text label
-            if duration > 5:  # Only show label if phase is long enough
-                ax.text(start_time + duration/2, 0, phase, 
-                       ha='center', va='center', fontweight='bold', fontsize=10)
+    import matplotlib.pyplot as plt
+    
+    fig, ax = plt.subplots(figsize=(14, 4), dpi=100)
+    
+    starts = phase_bounds['first'].to_numpy()
+    durations = phase_bounds['last'].to_numpy() - starts
+    colors = _phase_colors(df, phase_bounds)
+    
+    # Draw all phases as a single collection
+    ax.broken_barh(list(zip(starts, durations)), (-0.4, 0.8),
+                   facecolors=colors, edgecolor='black', linewidth=1.5)
+    
+    for phase, start_time, duration in zip(phase_bounds.index, starts, durations):
+        # Add text label
+        if duration > 5:  # Only show label if phase is long enough
+            ax.text(start_time + duration/2, 0, phase, 
+                   ha='center', va='center', fontweight='bold', fontsize=10)
     
     ax.set_xlabel('Simulation Time (s)', fontsize=12)
     ax.set_yticks([])
     ax.set_title('Flight Phase Timeline', fontsize=14, fontweight='bold')
-    ax.set_xlim(df['SimulationTime'].min(), df['SimulationTime'].max())
+    ax.set_xlim(*time_range)
     ax.grid(True, axis='x', alpha=0.3)
     
     plt.tight_layout()
     return fig
 
-def print_statistics(df):
+def print_statistics(df, phase_bounds, time_range):
     """Print flight statistics."""
     print("\n" + "="*60)
     print("FLIGHT STATISTICS")
     print("="*60)
     
-    print(f"\nDuration: {df['SimulationTime'].max():.1f} seconds")
+    # Gather the column reductions in a single agg call
+    stats = df.agg({
+        'Altitude': ['max', 'min'],
+        'Airspeed': ['max', 'mean'],
+        'VerticalSpeed': ['max', 'min'],
+        'ActiveFaults': ['sum', 'max'],
+    })
+    
+    print(f"\nDuration: {time_range[1]:.1f} seconds")
     print(f"\nAltitude:")
-    print(f"  Maximum: {df['Altitude'].max():.1f} m")
-    print(f"  Minimum: {df['Altitude'].min():.1f} m")
+    print(f"  Maximum: {stats.loc['max', 'Altitude']:.1f} m")
+    print(f"  Minimum: {stats.loc['min', 'Altitude']:.1f} m")
     
     print(f"\nAirspeed:")
-    print(f"  Maximum: {df['Airspeed'].max():.1f} m/s")
-    print(f"  Average: {df['Airspeed'].mean():.1f} m/s")
+    print(f"  Maximum: {stats.loc['max', 'Airspeed']:.1f} m/s")
+    print(f"  Average: {stats.loc['mean', 'Airspeed']:.1f} m/s")
     
     print(f"\nVertical Speed:")
-    print(f"  Maximum climb: {df['VerticalSpeed'].max():.1f} m/s")
-    print(f"  Maximum descent: {df['VerticalSpeed'].min():.1f} m/s")
+    print(f"  Maximum climb: {stats.loc['max', 'VerticalSpeed']:.1f} m/s")
+    print(f"  Maximum descent: {stats.loc['min', 'VerticalSpeed']:.1f} m/s")
     
     print(f"\nFlight Phases:")
-    for phase in df['FlightPhase'].unique():
-        phase_data = df[df['FlightPhase'] == phase]
-        duration = phase_data['SimulationTime'].iloc[-1] - phase_data['SimulationTime'].iloc[0]
+    # Total time per phase, summed over repeated visits
+    durations = ((phase_bounds['last'] - phase_bounds['first'])
+                 .groupby(level=0, sort=False).sum())
+    for phase, duration in durations.items():
         print(f"  {phase}: {duration:.1f} seconds")
     
     print(f"\nFaults:")
-    total_faults = df['ActiveFaults'].sum()
-    max_faults = df['ActiveFaults'].max()
-    print(f"  Total fault-seconds: {total_faults:.0f}")
-    print(f"  Maximum concurrent faults: {max_faults:.0f}")
+    print(f"  Total fault-seconds: {stats.loc['sum', 'ActiveFaults']:.0f}")
+    print(f"  Maximum concurrent faults: {stats.loc['max', 'ActiveFaults']:.0f}")
     
-    sensor_valid_pct = (df['SensorValid'] == True).sum() / len(df) * 100
+    sensor_valid_pct = df['SensorValid'].to_numpy().mean() * 100.0
     print(f"\nSensor Health:")
     print(f"  Valid readings: {sensor_valid_pct:.1f}%")
     
     print("\n" + "="*60 + "\n")
 
+def _init_save_worker():
+    """Select the headless backend before any figure is unpickled."""
+    _configure_matplotlib('Agg')
+
+def _render_png(fig, path):
+    """Render a figure to PNG at print resolution."""
+    # Compute the tight bounding box once rather than letting savefig do a
+    # trial layout, and favour encoding speed over PNG size
+    bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(0.1)
+    fig.savefig(path, dpi=300, bbox_inches=bbox,
+                pil_kwargs={'compress_level': 1})
+
+def _save_figure(payload, path):
+    """Unpickle a figure and render it to a PNG file."""
+    _render_png(pickle.loads(payload), path)
+    return path
+
+def save_figures(figures):
+    """Render (figure, path) pairs to disk in parallel worker processes."""
+    workers = min(len(figures), os.cpu_count() or 1)
+    if workers <= 1:
+        for fig, path in figures:
+            _render_png(fig, path)
+        return
+    
+    # Spawned workers start clean, so no GUI backend state is inherited
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_save_worker) as pool:
+        futures = [pool.submit(_save_figure, pickle.dumps(fig), path)
+                   for fig, path in figures]
+        for future in futures:
+            future.result()
+
+def _has_display():
+    """Return False on X11/Wayland systems with no display to show plots on."""
+    if not sys.platform.startswith('linux'):
+        return True
+    return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Visualize Avionics System Simulator telemetry.",
+        epilog="Example: python visualize_telemetry.py logs/flight_data_20250125_103045.csv")
+    parser.add_argument('filename', help="telemetry CSV file")
+    parser.add_argument('--stats-only', '--no-plots', action='store_true',
+                        help="print flight statistics without generating plots")
+    parser.add_argument('--no-show', action='store_true',
+                        help="save plots without displaying them")
+    return parser.parse_args(argv)
+
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python visualize_telemetry.py <telemetry_csv_file>")
-        print("\nExample: python visualize_telemetry.py logs/flight_data_20250125_103045.csv")
-        sys.exit(1)
-    
-    filename = sys.argv[1]
+    args = parse_args()
     
     # Load data
-    df = load_telemetry(filename)
+    df = load_telemetry(args.filename)
+    phase_bounds = compute_phase_bounds(df)
+    time_range = compute_time_range(df)
     
     # Print statistics
-    print_statistics(df)
+    print_statistics(df, phase_bounds, time_range)
+    
+    if args.stats_only:
+        return
+    if df.empty:
+        print("No telemetry rows to plot")
+        return
     
     # Create visualizations
     print("Generating visualizations...")
     
-    fig1 = plot_flight_profile(df)
+    # Saving only needs the headless Agg backend, which skips GUI start-up
+    show = not args.no_show and _has_display()
+    _configure_matplotlib(None if show else 'Agg')
+    import matplotlib.pyplot as plt
+    
+    fig1 = plot_flight_profile(df, phase_bounds)
     fig2 = plot_control_surfaces(df)
     fig3 = plot_sensor_data(df)
-    fig4 = plot_phase_timeline(df)
+    fig4 = plot_phase_timeline(df, phase_bounds, time_range)
     
     # Save figures
     output_dir = "plots"
@@ -250,16 +537,19 @@ def main():
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    fig1.savefig(f"{output_dir}/flight_profile_{timestamp}.png", dpi=300, bbox_inches='tight')
-    fig2.savefig(f"{output_dir}/control_surfaces_{timestamp}.png", dpi=300, bbox_inches='tight')
-    fig3.savefig(f"{output_dir}/sensor_data_{timestamp}.png", dpi=300, bbox_inches='tight')
-    fig4.savefig(f"{output_dir}/phase_timeline_{timestamp}.png", dpi=300, bbox_inches='tight')
+    save_figures([
+        (fig1, f"{output_dir}/flight_profile_{timestamp}.png"),
+        (fig2, f"{output_dir}/control_surfaces_{timestamp}.png"),
+        (fig3, f"{output_dir}/sensor_data_{timestamp}.png"),
+        (fig4, f"{output_dir}/phase_timeline_{timestamp}.png"),
+    ])
     
     print(f"\nPlots saved to {output_dir}/ directory")
     
     # Display plots
-    print("\nDisplaying plots... (close windows to exit)")
-    plt.show()
+    if show:
+        print("\nDisplaying plots... (close windows to exit)")
+        plt.show()
 
 if __name__ == "__main__":
     main()